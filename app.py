@@ -9,25 +9,38 @@ from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
 from pymongo import MongoClient
 from bson import ObjectId
+from collections import Counter
 from datetime import datetime
 import os
 from dotenv import load_dotenv
-import pandas as pd
-import numpy as np
-import gridfs
 
 load_dotenv()
 
 app = Flask(__name__)
 CORS(app)
 
-# MongoDB connection
-client = MongoClient(os.getenv('MONGO_URI', 'mongodb://localhost:27017/'))
+# MongoDB connection (connect=False defers the handshake to the first query,
+# so worker boot and /api/health never wait on the database)
+client = MongoClient(os.getenv('MONGO_URI', 'mongodb://localhost:27017/'), connect=False)
 db = client['gt_landmarks']
 landmarks_collection = db['landmarks']
 users_collection = db['users']
 visits_collection = db['visits']
-fs = gridfs.GridFS(db)
+_fs = None
+
+
+def get_fs():
+    """Return the GridFS handle, importing gridfs on first use."""
+    global _fs
+    if _fs is None:
+        import gridfs
+        _fs = gridfs.GridFS(db)
+    return _fs
+
+
+def count_visits_by(field):
+    """Count visits grouped by the given id field ('user_id' or 'landmark_id')."""
+    return Counter(visit[field] for visit in visits_collection.find({}, {field: 1}))
 
 
 def serialize(doc):
@@ -51,18 +64,13 @@ def get_landmarks():
     if not landmarks:
         return jsonify({'landmarks': []}), 200
     
-    df = pd.DataFrame(landmarks)
-    df['image_count'] = df['training_images'].apply(lambda x: len(x) if isinstance(x, list) else 0)
-    
-    visits = list(visits_collection.find())
-    if visits:
-        visits_df = pd.DataFrame(visits)
-        visit_counts = visits_df.groupby('landmark_id').size().to_dict()
-        df['visit_count'] = df['_id'].map(visit_counts).fillna(0).astype(int)
-    else:
-        df['visit_count'] = 0
+    visit_counts = count_visits_by('landmark_id')
+    for lm in landmarks:
+        images = lm.get('training_images')
+        lm['image_count'] = len(images) if isinstance(images, list) else 0
+        lm['visit_count'] = visit_counts.get(lm['_id'], 0)
     
-    return jsonify({'landmarks': [serialize(lm) for lm in df.to_dict('records')]}), 200
+    return jsonify({'landmarks': [serialize(lm) for lm in landmarks]}), 200
 
 
 @app.route('/api/landmarks/<landmark_id>', methods=['GET'])
@@ -110,16 +118,11 @@ def get_users():
     if not users:
         return jsonify({'users': []}), 200
     
-    df = pd.DataFrame(users)
-    visits = list(visits_collection.find())
-    if visits:
-        visits_df = pd.DataFrame(visits)
-        visit_counts = visits_df.groupby('user_id').size().to_dict()
-        df['visit_count'] = df['_id'].map(visit_counts).fillna(0).astype(int)
-    else:
-        df['visit_count'] = 0
+    visit_counts = count_visits_by('user_id')
+    for u in users:
+        u['visit_count'] = visit_counts.get(u['_id'], 0)
     
-    return jsonify({'users': [serialize(u) for u in df.to_dict('records')]}), 200
+    return jsonify({'users': [serialize(u) for u in users]}), 200
 
 
 @app.route('/api/users/<user_id>', methods=['GET'])
@@ -223,24 +226,24 @@ def get_analytics():
     
     if landmarks:
         image_counts = [len(lm.get('training_images', [])) for lm in landmarks]
-        analytics['total_images'] = int(np.sum(image_counts))
-        analytics['avg_images_per_landmark'] = float(np.mean(image_counts))
+        analytics['total_images'] = sum(image_counts)
+        analytics['avg_images_per_landmark'] = sum(image_counts) / len(image_counts)
     
     if visits:
-        visits_df = pd.DataFrame(visits)
-        
         top_landmarks = []
-        for landmark_id, count in visits_df['landmark_id'].value_counts().head(5).items():
+        landmark_counts = Counter(v['landmark_id'] for v in visits)
+        for landmark_id, count in landmark_counts.most_common(5):
             landmark = landmarks_collection.find_one({'_id': landmark_id})
             if landmark:
-                top_landmarks.append({'name': landmark['name'], 'visits': int(count)})
+                top_landmarks.append({'name': landmark['name'], 'visits': count})
         analytics['top_landmarks'] = top_landmarks
         
         top_users = []
-        for user_id, count in visits_df['user_id'].value_counts().head(5).items():
+        user_counts = Counter(v['user_id'] for v in visits)
+        for user_id, count in user_counts.most_common(5):
             user = users_collection.find_one({'_id': user_id})
             if user:
-                top_users.append({'username': user['username'], 'visits': int(count)})
+                top_users.append({'username': user['username'], 'visits': count})
         analytics['top_users'] = top_users
     
     return jsonify({'analytics': analytics}), 200
@@ -252,7 +255,7 @@ def get_analytics():
 def get_image(filename):
     """Serve image stored in GridFS"""
     try:
-        grid_file = fs.find_one({'filename': filename})
+        grid_file = get_fs().find_one({'filename': filename})
         if not grid_file:
             return jsonify({'error': 'Image not found'}), 404
 
@@ -0,0 +1,98 @@
+"""
+Report cold-start import time and RSS per module.
+
+Usage:
+    python scripts/startup_report.py
+    python scripts/startup_report.py --budget-ms 800 --budget-mb 60
+
+Each module is imported in a fresh interpreter, so the numbers include its
+own dependencies and match what a new gunicorn worker pays. The last row is
+the full `app` import; the script exits non-zero if it goes over budget.
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+# Configuration
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+DEFAULT_BUDGET_MS = float(os.getenv('STARTUP_BUDGET_MS', '1000'))
+DEFAULT_BUDGET_MB = float(os.getenv('STARTUP_BUDGET_MB', '80'))
+
+# Modules imported by app.py at load time, then the app itself
+MODULES = ['flask', 'flask_cors', 'pymongo', 'bson', 'dotenv', 'app']
+
+# Runs inside the child interpreter: prints elapsed ms and RSS before/after in KB
+PROBE = """
+import json, sys, time
+
+def rss_kb():
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+before = rss_kb()
+start = time.perf_counter()
+__import__(sys.argv[1])
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({'ms': elapsed, 'rss_before_kb': before, 'rss_after_kb': rss_kb()}))
+"""
+
+
+def measure(module):
+    """Import a module in a fresh interpreter and return its timing, or None on failure."""
+    proc = subprocess.run(
+        [sys.executable, '-c', PROBE, module],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        return None
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def startup_report(budget_ms, budget_mb):
+    """Print the per-module table and return True if the app is within budget."""
+    print(f"{'module':<12} {'import ms':>10} {'RSS MB':>8} {'+RSS MB':>8}")
+    app_result = None
+    for module in MODULES:
+        result = measure(module)
+        if result is None:
+            print(f"{module:<12} {'import failed':>28}")
+            continue
+        rss_mb = result['rss_after_kb'] / 1024
+        delta_mb = (result['rss_after_kb'] - result['rss_before_kb']) / 1024
+        print(f"{module:<12} {result['ms']:>10.1f} {rss_mb:>8.1f} {delta_mb:>8.1f}")
+        if module == 'app':
+            app_result = result
+
+    print()
+    if app_result is None:
+        print("✗ Could not import app")
+        return False
+
+    app_ms = app_result['ms']
+    app_mb = app_result['rss_after_kb'] / 1024
+    ok = app_ms <= budget_ms and app_mb <= budget_mb
+    mark = '✓' if ok else '✗'
+    print(f"{mark} app cold start: {app_ms:.1f} ms (budget {budget_ms:.0f}), "
+          f"{app_mb:.1f} MB RSS (budget {budget_mb:.0f})")
+    return ok
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument('--budget-mb', type=float, default=DEFAULT_BUDGET_MB)
+    args = parser.parse_args()
+    sys.exit(0 if startup_report(args.budget_ms, args.budget_mb) else 1)